@@ -2,34 +2,105 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import asyncio
+import hashlib
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
 from dataclasses import dataclass, field
 from typing import Any
 
 import structlog
 from dedalus_labs import DedalusRunner
 
+from backend.models import AgentRole
+
 logger = structlog.get_logger()
 
 # Message dicts follow the OpenAI-compatible format:
 # {"role": "system"|"user"|"assistant", "content": "..."}
-Message = dict[str, str]
+# The system turn may carry a list of content blocks instead of
+# a plain string so it can be marked for prompt caching.
+Message = dict[str, Any]
+
+# Anthropic only reuses a cached prefix when the block is marked
+# explicitly; OpenAI caches identical prefixes automatically.
+_CACHE_CONTROL: dict[str, str] = {"type": "ephemeral"}
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentConfig:
     """Configuration for a single debate agent.
 
     The `models` field accepts a list for Dedalus handoff routing
     (routes subtasks to different models based on strengths),
-    or a single string for no handoff.
+    or a single string for no handoff. Configs are immutable so
+    one instance can be shared safely across turns and sessions:
+    the agent modules build each config once at import, and
+    configs that need a per-debate tool are module-level
+    templates copied with `dataclasses.replace(template, tools=...)`.
     """
 
-    role: str
+    role: AgentRole
     models: list[str] | str
     system_prompt: str
-    mcp_servers: list[str] = field(default_factory=list)
-    tools: list[Callable[..., Any]] = field(default_factory=list)
+    mcp_servers: tuple[str, ...] = ()
+    tools: tuple[Callable[..., Any], ...] = ()
+    # Let the model emit several tool calls per turn (None = provider default)
+    parallel_tool_calls: bool | None = None
+    # Built once per config; shared read-only by every request.
+    system_msg: Message = field(init=False, repr=False, compare=False)
+    # Every runner.run argument except `messages` is fixed per config.
+    run_kwargs: dict[str, Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "system_msg", _system_message(self))
+        prompt_digest = hashlib.sha256(self.system_prompt.encode()).hexdigest()[:8]
+        object.__setattr__(
+            self,
+            "run_kwargs",
+            {
+                "model": self.models,
+                # runner.run expects None (not []) for "no servers/tools"
+                "mcp_servers": list(self.mcp_servers) or None,
+                "tools": list(self.tools) or None,
+                "parallel_tool_calls": self.parallel_tool_calls,
+                # One key per distinct static prefix: a role's opening
+                # and cross-exam prompts must not share a cache bucket
+                "prompt_cache_key": f"courtroom-{self.role}-{prompt_digest}",
+                "stream": True,
+            },
+        )
+
+
+def _supports_cache_control(models: list[str] | str) -> bool:
+    """Return True if every model in the routing list is Anthropic.
+
+    Mixed handoff lists fall back to a plain string system prompt,
+    since not every provider accepts `cache_control` blocks.
+    """
+    if isinstance(models, str):
+        return models.startswith("anthropic/")
+    return all(model.startswith("anthropic/") for model in models)
+
+
+def _system_message(config: AgentConfig) -> Message:
+    """Build the system turn for an agent.
+
+    The system prompt is static per role, so it is the cacheable
+    prefix of every request. Anthropic models get it as a
+    `cache_control` text block; others get a plain string.
+    """
+    if _supports_cache_control(config.models):
+        return {
+            "role": "system",
+            "content": [
+                {
+                    "type": "text",
+                    "text": config.system_prompt,
+                    "cache_control": _CACHE_CONTROL,
+                }
+            ],
+        }
+    return {"role": "system", "content": config.system_prompt}
 
 
 def build_messages(
@@ -40,12 +111,10 @@ def build_messages(
 
     Prepends the agent's system prompt, then appends
     the conversation history (prior agent turns, evidence,
-    directives, user input).
+    directives, user input). The static system prompt always
+    comes first so it forms a cacheable prefix.
     """
-    return [
-        {"role": "system", "content": config.system_prompt},
-        *history,
-    ]
+    return [config.system_msg, *history]
 
 
 def start_agent_stream(
@@ -72,10 +141,94 @@ def start_agent_stream(
         message_count=len(messages),
     )
 
-    return runner.run(
-        messages=messages,
-        model=config.models,
-        mcp_servers=config.mcp_servers or None,
-        tools=config.tools or None,
-        stream=True,
-    )
+    return runner.run(messages=messages, **config.run_kwargs)
+
+
+def _chunk_content(chunk: Any) -> str | None:
+    """Return the content token of a stream chunk, if any."""
+    # Content chunks are the common case, so read the path
+    # directly and only pay for the lookup failure otherwise.
+    try:
+        return chunk.choices[0].delta.content or None
+    except (AttributeError, IndexError, TypeError):
+        return None
+
+
+async def batched_stream(
+    raw: AsyncIterator[Any],
+    max_delay_ms: float = 30,
+    max_tokens: int = 16,
+    max_chars: int = 4096,
+    wake: asyncio.Event | None = None,
+) -> AsyncGenerator[str, None]:
+    """Coalesce a raw agent stream into batches of text.
+
+    Collects content tokens until `max_tokens` have arrived,
+    `max_chars` of text are buffered, or `max_delay_ms` has
+    passed since the first chunk of the batch, then yields them
+    joined into one string. The size cap keeps one oversized
+    frame from stalling the socket. A batch is empty when only
+    non-content chunks (tool calls, role deltas) arrived, so the
+    caller still gets to check for interventions while the model
+    is busy with tools.
+
+    Setting the optional `wake` event flushes the current batch
+    at once, even while the model is silent, so the caller can
+    act on an interrupt without waiting for the next chunk.
+
+    Close the generator (e.g. via `contextlib.aclosing`) when
+    stopping early so the underlying stream is cancelled.
+    """
+    loop = asyncio.get_running_loop()
+    pending: asyncio.Future[Any] | None = None
+    tokens: list[str] = []
+    chars = 0
+    deadline: float | None = None
+    woken = None if wake is None else asyncio.ensure_future(wake.wait())
+
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(anext(raw))
+            timeout = None if deadline is None else max(deadline - loop.time(), 0)
+            waiting = (pending,) if woken is None else (pending, woken)
+            done, _ = await asyncio.wait(
+                waiting, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+
+            if woken in done:
+                # Flush now; the caller takes over from here
+                woken = None
+            elif done:
+                try:
+                    chunk = pending.result()
+                except StopAsyncIteration:
+                    pending = None
+                    break
+                pending = None
+                if deadline is None:
+                    deadline = loop.time() + max_delay_ms / 1000
+                token = _chunk_content(chunk)
+                if token:
+                    tokens.append(token)
+                    chars += len(token)
+                if (
+                    len(tokens) < max_tokens
+                    and chars < max_chars
+                    and loop.time() < deadline
+                ):
+                    continue
+
+            batch = "".join(tokens)
+            tokens.clear()
+            chars = 0
+            deadline = None
+            yield batch
+
+        if tokens:
+            yield "".join(tokens)
+    finally:
+        if pending is not None:
+            pending.cancel()
+        if woken is not None:
+            woken.cancel()
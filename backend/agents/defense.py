@@ -1,10 +1,25 @@
 """Defense agent configuration."""
 
+from dataclasses import replace
+
 from backend.agents.base import AgentConfig
 from backend.agents.prompts import DEFENSE_CROSS_PROMPT, DEFENSE_SYSTEM_PROMPT
 from backend.agents.tools import Citation
 from backend.config import DEFENSE_MODELS, MCP_BRAVE_SEARCH, MCP_VALYU
 
+_DEFENSE_TEMPLATE = AgentConfig(
+    role="defense",
+    models=DEFENSE_MODELS,
+    system_prompt=DEFENSE_SYSTEM_PROMPT,
+    mcp_servers=(MCP_BRAVE_SEARCH, MCP_VALYU),
+)
+
+_DEFENSE_CROSS_CONFIG = AgentConfig(
+    role="defense",
+    models=DEFENSE_MODELS,
+    system_prompt=DEFENSE_CROSS_PROMPT,
+)
+
 
 def create_defense_config(citations: Citation) -> AgentConfig:
     """Create the defense agent configuration.
@@ -15,12 +30,9 @@ def create_defense_config(citations: Citation) -> AgentConfig:
     Local tools: format_evidence so new findings are
     tracked and forwarded to the frontend.
     """
-    return AgentConfig(
-        role="defense",
-        models=DEFENSE_MODELS,
-        system_prompt=DEFENSE_SYSTEM_PROMPT,
-        mcp_servers=[MCP_BRAVE_SEARCH, MCP_VALYU],
-        tools=[citations.make_format_evidence_tool()],
+    return replace(
+        _DEFENSE_TEMPLATE,
+        tools=(citations.make_format_evidence_tool(),),
     )
 
 
@@ -30,8 +42,4 @@ def create_defense_cross_config() -> AgentConfig:
     No MCP servers or tools - cross-exam uses only 
     existing evidence from the discovery phase.
     """
-    return AgentConfig(
-        role="defense",
-        models=DEFENSE_MODELS,
-        system_prompt=DEFENSE_CROSS_PROMPT,
-    )
+    return _DEFENSE_CROSS_CONFIG
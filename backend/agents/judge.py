@@ -4,6 +4,12 @@ from backend.agents.base import AgentConfig
 from backend.agents.prompts import JUDGE_SYSTEM_PROMPT
 from backend.config import JUDGE_MODEL
 
+_JUDGE_CONFIG = AgentConfig(
+    role="judge",
+    models=JUDGE_MODEL,
+    system_prompt=JUDGE_SYSTEM_PROMPT,
+)
+
 
 def create_judge_config() -> AgentConfig:
     """Create the judge agent configuration.
@@ -11,8 +17,4 @@ def create_judge_config() -> AgentConfig:
     Uses a single model (no handoff). No MCP servers or
     tools — the judge only analyzes the existing transcript.
     """
-    return AgentConfig(
-        role="judge",
-        models=JUDGE_MODEL,
-        system_prompt=JUDGE_SYSTEM_PROMPT,
-    )
+    return _JUDGE_CONFIG
@@ -1,14 +1,28 @@
-"""System prompt templates for debate agents."""
+"""System prompt templates for debate agents.
+
+Prompts must stay static: no dilemma text or other per-debate data
+is interpolated here. The system prompt is the first message of
+every request, so keeping it byte-identical lets providers serve it
+from their prefix cache (OpenAI caches prefixes of 1024+ tokens
+automatically). Per-debate content goes in the user/assistant turns
+built by the orchestrator.
+"""
+
+__all__ = [
+    "RESEARCHER_SYSTEM_PROMPT",
+    "DEFENSE_SYSTEM_PROMPT",
+    "PROSECUTION_SYSTEM_PROMPT",
+    "PROSECUTION_CROSS_PROMPT",
+    "DEFENSE_CROSS_PROMPT",
+    "JUDGE_SYSTEM_PROMPT",
+]
 
 # Shared evidence citation rules — kept DRY across prompts.
 _EVIDENCE_RULES = """\
 EVIDENCE RULES:
-- Cite evidence: "claim text [tool_abc123]"
-- Search brave_search for additional evidence, or use \
-valyu academic search for research papers and studies, then \
-call format_evidence() to register it with the court \
-It is expensive to format_evidence, so try to work with what the researcher gave.
-- Uncited factual claims are flagged UNSUPPORTED"""
+- Cite as "claim [tool_abc123]"; uncited facts are flagged UNSUPPORTED
+- Prefer the researcher's evidence. New evidence (brave_search, \
+valyu for papers) must go through format_evidence(), which is expensive"""
 
 RESEARCHER_SYSTEM_PROMPT = """\
 You are the Court Researcher in an adversarial evidence court.
@@ -21,7 +35,10 @@ RESEARCH PROTOCOL:
 4. Use valyu academic search for peer-reviewed papers, ArXiv \
 preprints, and PubMed studies when the dilemma involves \
 scientific, medical, or technical claims
-5. For EACH piece of evidence found, call format_evidence() with:
+   Run steps 2-4 as parallel tool calls in a single turn, not \
+one search after another.
+5. For EACH piece of evidence found, call format_evidence() \
+(batch these calls in one turn as well) with:
    - title, snippet, source, source_type, date, url. The url should be the exact url from \
    the search, such that you can follow the link. 
 6. After gathering all evidence, call deduplicate_sources() \
@@ -1,5 +1,7 @@
 """Prosecution agent configuration."""
 
+from dataclasses import replace
+
 from backend.agents.base import AgentConfig
 from backend.agents.prompts import (
     PROSECUTION_CROSS_PROMPT,
@@ -8,6 +10,19 @@ from backend.agents.prompts import (
 from backend.agents.tools import Citation
 from backend.config import MCP_BRAVE_SEARCH, MCP_VALYU, PROSECUTION_MODELS
 
+_PROSECUTION_TEMPLATE = AgentConfig(
+    role="prosecution",
+    models=PROSECUTION_MODELS,
+    system_prompt=PROSECUTION_SYSTEM_PROMPT,
+    mcp_servers=(MCP_BRAVE_SEARCH, MCP_VALYU),
+)
+
+_PROSECUTION_CROSS_CONFIG = AgentConfig(
+    role="prosecution",
+    models=PROSECUTION_MODELS,
+    system_prompt=PROSECUTION_CROSS_PROMPT,
+)
+
 
 def create_prosecution_config(citations: Citation) -> AgentConfig:
     """Create the prosecution agent configuration.
@@ -18,12 +33,9 @@ def create_prosecution_config(citations: Citation) -> AgentConfig:
     Local tools: format_evidence so new findings are
     tracked and forwarded to the frontend.
     """
-    return AgentConfig(
-        role="prosecution",
-        models=PROSECUTION_MODELS,
-        system_prompt=PROSECUTION_SYSTEM_PROMPT,
-        mcp_servers=[MCP_BRAVE_SEARCH, MCP_VALYU],
-        tools=[citations.make_format_evidence_tool()],
+    return replace(
+        _PROSECUTION_TEMPLATE,
+        tools=(citations.make_format_evidence_tool(),),
     )
 
 
@@ -33,8 +45,4 @@ def create_prosecution_cross_config() -> AgentConfig:
     No MCP servers or tools — cross-exam uses only
     existing evidence from the discovery phase.
     """
-    return AgentConfig(
-        role="prosecution",
-        models=PROSECUTION_MODELS,
-        system_prompt=PROSECUTION_CROSS_PROMPT,
-    )
+    return _PROSECUTION_CROSS_CONFIG
@@ -1,5 +1,7 @@
 """Researcher agent configuration."""
 
+from dataclasses import replace
+
 from backend.agents.base import AgentConfig
 from backend.agents.prompts import RESEARCHER_SYSTEM_PROMPT
 from backend.agents.tools import Citation
@@ -10,6 +12,14 @@ from backend.config import (
     RESEARCHER_MODELS,
 )
 
+_RESEARCHER_TEMPLATE = AgentConfig(
+    role="researcher",
+    models=RESEARCHER_MODELS,
+    system_prompt=RESEARCHER_SYSTEM_PROMPT,
+    mcp_servers=(MCP_BRAVE_SEARCH, MCP_EXA, MCP_VALYU),
+    parallel_tool_calls=True,
+)
+
 
 def create_researcher_config(citations: Citation) -> AgentConfig:
     """Create the researcher agent configuration.
@@ -19,13 +29,10 @@ def create_researcher_config(citations: Citation) -> AgentConfig:
     MCP: brave-search for web/news, exa for semantic search,
     valyu for academic papers (ArXiv, PubMed, scholarly DBs).
     Local tools: format_evidence, deduplicate_sources.
+    Parallel tool calls let one turn query all three MCP
+    servers at once instead of one after another.
     """
-    return AgentConfig(
-        role="researcher",
-        models=RESEARCHER_MODELS,
-        system_prompt=RESEARCHER_SYSTEM_PROMPT,
-        mcp_servers=[MCP_BRAVE_SEARCH, MCP_EXA, MCP_VALYU],
-        tools=[
-            citations.make_format_evidence_tool(),
-        ],
+    return replace(
+        _RESEARCHER_TEMPLATE,
+        tools=(citations.make_format_evidence_tool(),),
     )
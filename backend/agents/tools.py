@@ -9,7 +9,15 @@ searching; these tools handle evidence formatting.
 from __future__ import annotations
 
 import asyncio
-import uuid
+import itertools
+from collections.abc import AsyncIterator
+
+import structlog
+
+logger = structlog.get_logger()
+
+# Far more than a debate produces; only a stalled forwarder fills it
+MAX_QUEUED_EVIDENCE = 256
 
 
 class Citation:
@@ -18,13 +26,58 @@ class Citation:
     """
 
     def __init__(self) -> None:
-        self.evidence_queue: asyncio.Queue[dict[str, str]] = asyncio.Queue()
+        self.evidence_queue: asyncio.Queue[dict[str, str]] = asyncio.Queue(
+            maxsize=MAX_QUEUED_EVIDENCE
+        )
+        # Evidence IDs only need to be unique within one debate
+        self._evidence_ids = itertools.count(1)
+        # Registered evidence by normalized URL (or title when there
+        # is no URL), so a repeated citation reuses its ID
+        self._registered: dict[str, dict[str, str]] = {}
+        # Build each tool once so every agent in the debate gets the
+        # same function object.
+        self._format_evidence_tool = self._build_format_evidence_tool()
+        self._deduplicate_sources_tool = self._build_deduplicate_sources_tool()
 
     def add_evidence(self, evidence_dict: dict[str, str]) -> None:
         """Adds evidence to the queue for immediate forwarding."""
-        self.evidence_queue.put_nowait(evidence_dict)
+        try:
+            self.evidence_queue.put_nowait(evidence_dict)
+        except asyncio.QueueFull:
+            logger.warning("evidence_dropped", evidence_id=evidence_dict["id"])
+
+    async def drain(self, max_items: int = 32) -> AsyncIterator[list[dict[str, str]]]:
+        """Yield evidence as soon as it is registered.
+
+        Waits for the first item, then takes whatever else is
+        already queued (up to `max_items`) without waiting, so a
+        burst of tool calls becomes one batch while a lone item
+        is still yielded immediately.
+        """
+        while True:
+            batch = [await self.evidence_queue.get()]
+            batch.extend(self.take_queued(max_items - 1))
+            yield batch
+
+    def take_queued(self, max_items: int | None = None) -> list[dict[str, str]]:
+        """Remove and return evidence already queued, without waiting."""
+        batch: list[dict[str, str]] = []
+        while max_items is None or len(batch) < max_items:
+            try:
+                batch.append(self.evidence_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
 
     def make_format_evidence_tool(self):
+        """Returns the format evidence tool for the MCP"""
+        return self._format_evidence_tool
+
+    def make_deduplicate_sources_tool(self):
+        """Returns the deduplicate sources tool for the MCP"""
+        return self._deduplicate_sources_tool
+
+    def _build_format_evidence_tool(self):
         """Creates the make format evidence tool for the MCP"""
 
         def make_format_evidence(
@@ -39,7 +92,8 @@ class Citation:
 
             Call this after finding relevant information from a search.
             Returns a structured evidence object with a unique ID that
-            agents can cite using [TOOL:<id>] notation.
+            agents can cite using [TOOL:<id>] notation. A source that
+            was already registered returns its existing object.
 
             Args:
                 title: Title of the source (article, paper, page).
@@ -49,7 +103,17 @@ class Citation:
                 date: Publication date if available (e.g. "2025-03").
                 url: URL of the source if available.
             """
-            evidence_id = f"tool_{uuid.uuid4().hex[:6]}"
+            # Titles like "Annual Report" are not unique, so the
+            # title only identifies a source that has no URL.
+            key: str | None = None
+            if normalized_url := url.strip().lower():
+                key = f"url:{normalized_url}"
+            elif normalized_title := title.strip().lower():
+                key = f"title:{normalized_title}"
+            if key is not None and key in self._registered:
+                return self._registered[key]
+
+            evidence_id = f"tool_{next(self._evidence_ids):06x}"
 
             evidence = {
                 "id": evidence_id,
@@ -60,17 +124,19 @@ class Citation:
                 "date": date,
                 "url": url,
             }
+            if key is not None:
+                self._registered[key] = evidence
             self.add_evidence(evidence)
 
             return evidence
 
         return make_format_evidence
 
-    def make_deduplicate_sources_tool(self):
+    def _build_deduplicate_sources_tool(self):
         def make_duplicate_sources(
             sources: list[dict[str, str]],
         ) -> list[dict[str, str]]:
-            """Remove duplicate evidence sources based on title similarity.
+            """Remove duplicate evidence sources based on title or URL.
 
             Call this after gathering evidence from multiple search tools
             to eliminate redundant results before presenting to the court.
@@ -82,12 +148,21 @@ class Citation:
                 Deduplicated list of evidence objects.
             """
             seen_titles: set[str] = set()
+            seen_urls: set[str] = set()
             unique: list[dict[str, str]] = []
             for src in sources:
-                normalized = src.get("title", "").strip().lower()
-                if normalized and normalized not in seen_titles:
-                    seen_titles.add(normalized)
-                    unique.append(src)
+                title = src.get("title", "").strip().lower()
+                if not title or title in seen_titles:
+                    continue
+                # The same page often comes back from several search
+                # tools under slightly different titles.
+                url = src.get("url", "").strip().lower()
+                if url and url in seen_urls:
+                    continue
+                seen_titles.add(title)
+                if url:
+                    seen_urls.add(url)
+                unique.append(src)
             return unique
 
         return make_duplicate_sources
@@ -10,11 +10,15 @@ load_dotenv()
 DEDALUS_API_KEY: str = os.getenv("DEDALUS_API_KEY", "")
 
 # --- Handoff Model Arrays ---
+# Cheap, fast model the handoff router can use for tool-call
+# turns (searches, format_evidence) instead of the writer model
+TOOL_CALL_MODEL: str = "openai/gpt-4.1-mini"
+
 # GPT for tool calls, Claude for persuasive writing
 DEFENSE_MODELS: list[str] = [
     "openai/gpt-5-mini",
     # "anthropic/claude-sonnet-4-5-20250929",
-    # "openai/gpt-4.1-mini",
+    TOOL_CALL_MODEL,
     # "openai/gpt-4.1",
 ]
 
@@ -22,7 +26,7 @@ DEFENSE_MODELS: list[str] = [
 PROSECUTION_MODELS: list[str] = [
     "openai/gpt-5-mini",
     # "anthropic/claude-sonnet-4-5-20250929",
-    # "openai/gpt-4.1-mini",
+    TOOL_CALL_MODEL,
     # "openai/gpt-4.1",
 ]
 
@@ -58,3 +62,6 @@ MCP_VALYU: str = f"https://mcp.valyu.ai/mcp?valyuApiKey={VALYU_API_KEY}"
 # --- Server ---
 WS_HOST: str = "0.0.0.0"
 WS_PORT: int = 8000
+
+# Log every incoming WebSocket frame (COURTROOM_DEBUG_WS=1)
+DEBUG_WS: bool = os.getenv("COURTROOM_DEBUG_WS") == "1"
@@ -13,13 +13,173 @@ Directory layout:
 from __future__ import annotations
 
 import logging
+import os
+import queue
+import socket
+import sys
+import time
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import Any
 
 import structlog
 
 _LOG_DIR: Path | None = None
 _session_handlers: dict[str, logging.Handler] = {}
+_listener: _LogListener | None = None
+
+# Fixed for the life of the process, so look them up once.
+_HOSTNAME = socket.gethostname()
+_PID = os.getpid()
+
+# Formatters are stateless; server.log and every session file share one.
+_CONSOLE_FORMATTER = structlog.stdlib.ProcessorFormatter(
+    processors=[
+        structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+        structlog.dev.ConsoleRenderer(),
+    ],
+)
+
+_FILE_FORMATTER = structlog.stdlib.ProcessorFormatter(
+    processors=[
+        structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+        structlog.processors.format_exc_info,
+        structlog.processors.JSONRenderer(),
+    ],
+)
+
+
+def _add_host_pid(
+    _logger: object, _method: str, event_dict: structlog.typing.EventDict
+) -> structlog.typing.EventDict:
+    """Tag every event with the cached hostname and pid."""
+    event_dict["host"] = _HOSTNAME
+    event_dict["pid"] = _PID
+    return event_dict
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """FileHandler that writes through a large buffer.
+
+    The stock handler flushes after every record, turning each
+    streamed event into its own small write. This one flushes
+    at most once per `flush_interval` seconds, plus right away
+    for WARNING and above, when the listener goes idle, and on
+    close.
+    """
+
+    def __init__(
+        self,
+        filename: Path,
+        buffer_size: int = 128 * 1024,
+        flush_interval: float = 1.0,
+    ) -> None:
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+        super().__init__(filename)
+
+    def _open(self):  # type: ignore[override]
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        if record.levelno >= logging.WARNING:
+            self.flush_now()
+
+    def flush(self) -> None:
+        now = time.monotonic()
+        if now - self._last_flush >= self.flush_interval:
+            self._last_flush = now
+            super().flush()
+
+    def flush_now(self) -> None:
+        """Write out the buffer regardless of the interval."""
+        self._last_flush = float("-inf")
+        self.flush()
+
+    def close(self) -> None:
+        self._last_flush = float("-inf")
+        super().close()
+
+
+class _RecordQueueHandler(QueueHandler):
+    """Enqueue records untouched.
+
+    The default `prepare` formats the message into a string,
+    which would strip the event dict ProcessorFormatter needs.
+    The listener runs in this process, so no pickling is needed.
+    `exc_info=True` is resolved here, since the exception is
+    gone by the time the listener thread renders the record.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        event_dict = record.msg
+        if isinstance(event_dict, dict) and event_dict.get("exc_info") is True:
+            event_dict["exc_info"] = sys.exc_info()
+        return record
+
+
+class _AddHandler:
+    """Queue marker: attach a handler ahead of the records that follow."""
+
+    def __init__(self, handler: logging.Handler) -> None:
+        self.handler = handler
+
+
+class _CloseHandler:
+    """Queue marker: detach and close a handler once earlier records are written."""
+
+    def __init__(self, handler: logging.Handler) -> None:
+        self.handler = handler
+
+
+class _LogListener(QueueListener):
+    """Writes queued records to disk on a background thread.
+
+    `handlers` is only ever replaced on this thread, via the
+    _AddHandler/_CloseHandler markers, so updates cannot race.
+    """
+
+    def __init__(
+        self,
+        log_queue: queue.SimpleQueue[Any],
+        *handlers: logging.Handler,
+        respect_handler_level: bool = False,
+    ) -> None:
+        super().__init__(
+            log_queue, *handlers, respect_handler_level=respect_handler_level
+        )
+        self._queue = log_queue
+
+    def dequeue(self, block: bool) -> Any:
+        try:
+            return self._queue.get_nowait()
+        except queue.Empty:
+            pass
+        # Caught up: put buffered lines on disk before waiting, so
+        # the last records of a burst never sit in memory.
+        for handler in self.handlers:
+            if isinstance(handler, _BufferedFileHandler):
+                handler.flush_now()
+        return self._queue.get(block)
+
+    def handle(self, record: logging.LogRecord | _AddHandler | _CloseHandler) -> None:
+        if isinstance(record, _AddHandler):
+            self.handlers = (*self.handlers, record.handler)
+            return
+        if isinstance(record, _CloseHandler):
+            self.handlers = tuple(h for h in self.handlers if h is not record.handler)
+            record.handler.close()
+            return
+        super().handle(record)
 
 
 def setup_logging() -> Path:
@@ -27,31 +187,18 @@ def setup_logging() -> Path:
 
     Creates ~/logs/courtroom_<timestamp>/ for this server
     instance. Call once at startup.
+    Log calls only enqueue the record; a background listener
+    thread does the console and file writes, so disk I/O never
+    blocks the event loop. Call shutdown_logging() at exit.
     Returns the log directory path.
     """
-    global _LOG_DIR
+    global _LOG_DIR, _listener
 
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
     _LOG_DIR = Path.cwd() / "logs" / f"courtroom_{timestamp}"
     _LOG_DIR.mkdir(parents=True, exist_ok=True)
     (_LOG_DIR / "sessions").mkdir(exist_ok=True)
 
-    # --- Formatters ---
-
-    console_formatter = structlog.stdlib.ProcessorFormatter(
-        processors=[
-            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
-            structlog.dev.ConsoleRenderer(),
-        ],
-    )
-
-    file_formatter = structlog.stdlib.ProcessorFormatter(
-        processors=[
-            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
-            structlog.processors.JSONRenderer(),
-        ],
-    )
-
     # --- Root stdlib logger ---
 
     root = logging.getLogger()
@@ -61,13 +208,21 @@ def setup_logging() -> Path:
 
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(console_formatter)
-    root.addHandler(console_handler)
+    console_handler.setFormatter(_CONSOLE_FORMATTER)
 
-    server_handler = logging.FileHandler(_LOG_DIR / "server.log")
+    server_handler = _BufferedFileHandler(_LOG_DIR / "server.log")
     server_handler.setLevel(logging.DEBUG)
-    server_handler.setFormatter(file_formatter)
-    root.addHandler(server_handler)
+    server_handler.setFormatter(_FILE_FORMATTER)
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root.addHandler(_RecordQueueHandler(log_queue))
+    _listener = _LogListener(
+        log_queue,
+        console_handler,
+        server_handler,
+        respect_handler_level=True,
+    )
+    _listener.start()
 
     # --- structlog → stdlib bridge ---
 
@@ -76,11 +231,12 @@ def setup_logging() -> Path:
             structlog.contextvars.merge_contextvars,
             structlog.processors.add_log_level,
             structlog.processors.TimeStamper(fmt="iso"),
+            _add_host_pid,
             structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
         logger_factory=structlog.stdlib.LoggerFactory(),
         wrapper_class=structlog.stdlib.BoundLogger,
-        cache_logger_on_first_use=False,
+        cache_logger_on_first_use=True,
     )
 
     structlog.get_logger().info(
@@ -90,6 +246,17 @@ def setup_logging() -> Path:
     return _LOG_DIR
 
 
+def shutdown_logging() -> None:
+    """Write out any queued records and stop the listener thread."""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
 def get_log_dir() -> Path:
     """Return the per-instance log directory."""
     assert _LOG_DIR is not None, "Call setup_logging() first"
@@ -102,38 +269,39 @@ def get_session_logger(
     """Get a logger that writes to both server.log and sessions/<id>.log.
 
     The session file handler is created on first call for a
-    given session_id. The returned logger has session= bound.
+    given session_id and added to the background listener,
+    filtered to this session's logger. The returned logger
+    has session= bound.
     """
+    name = f"courtroom.session.{session_id}"
     if session_id not in _session_handlers:
         assert _LOG_DIR is not None, "Call setup_logging() first"
+        assert _listener is not None, "Call setup_logging() first"
         session_file = _LOG_DIR / "sessions" / f"{session_id}.log"
 
-        file_formatter = structlog.stdlib.ProcessorFormatter(
-            processors=[
-                structlog.stdlib.ProcessorFormatter.remove_processors_meta,
-                structlog.processors.JSONRenderer(),
-            ],
-        )
-
-        handler = logging.FileHandler(session_file)
+        handler = _BufferedFileHandler(session_file)
         handler.setLevel(logging.DEBUG)
-        handler.setFormatter(file_formatter)
-
-        stdlib_logger = logging.getLogger(f"courtroom.session.{session_id}")
-        stdlib_logger.addHandler(handler)
-        stdlib_logger.setLevel(logging.DEBUG)
+        handler.setFormatter(_FILE_FORMATTER)
+        handler.addFilter(logging.Filter(name))
 
+        # The listener thread attaches it, so only that thread
+        # ever rewrites its handler list.
+        _listener.queue.put_nowait(_AddHandler(handler))
         _session_handlers[session_id] = handler
 
-    return structlog.get_logger(f"courtroom.session.{session_id}").bind(
-        session=session_id
-    )
+    return structlog.get_logger(name).bind(session=session_id)
 
 
 def cleanup_session_logger(session_id: str) -> None:
-    """Close and remove the file handler for a finished session."""
+    """Close and remove the file handler for a finished session.
+
+    The close is queued behind the session's pending records,
+    so its last lines still reach the file.
+    """
     handler = _session_handlers.pop(session_id, None)
-    if handler:
+    if handler is None:
+        return
+    if _listener is not None:
+        _listener.queue.put_nowait(_CloseHandler(handler))
+    else:
         handler.close()
-        stdlib_logger = logging.getLogger(f"courtroom.session.{session_id}")
-        stdlib_logger.removeHandler(handler)
@@ -7,8 +7,9 @@ import shutil
 import uuid
 from pathlib import Path
 from contextlib import asynccontextmanager
-from typing import AsyncIterator, List
+from typing import AsyncIterator, Awaitable, BinaryIO, Callable, List
 
+import httpx
 import structlog
 from dedalus_labs import AsyncDedalus, DedalusRunner
 from fastapi import (
@@ -18,14 +19,18 @@ from fastapi import (
     UploadFile,
     File,
     HTTPException,
+    Response,
 )
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from pydantic_core import from_json
 
+from backend.config import DEBUG_WS
 from backend.logging_config import (
     cleanup_session_logger,
     get_session_logger,
     setup_logging,
+    shutdown_logging,
 )
 from backend.models import (
     ErrorMessage,
@@ -41,14 +46,27 @@ logger = structlog.get_logger()
 
 # --- Shared State ---
 
+# One runner per process. Every agent turn in every session goes
+# through it, so all requests share the client's keep-alive
+# connection pool. Do not construct per-agent runners.
 runner: DedalusRunner | None = None
+# Shared by every session's OCR request so repeat uploads reuse
+# the TLS connection to the Dedalus API.
+http_client: httpx.AsyncClient | None = None
 UPLOAD_DIR = Path("data")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
-    """Create the Dedalus client and runner once at startup."""
-    global runner
+    """Create the Dedalus client, runner and HTTP client once at startup."""
+    global runner, http_client
+
+    # Tasks that finish without blocking (sends, short handlers)
+    # run to completion on creation instead of waiting a loop
+    # iteration. eager_task_factory needs Python 3.12+.
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
 
     # Ensure upload directory exists
     UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
@@ -60,9 +78,13 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     runner = DedalusRunner(client)
     logger.info("dedalus_client_ready")
 
+    http_client = httpx.AsyncClient(timeout=120.0)
+
     yield
 
     logger.info("shutting_down")
+    await http_client.aclose()
+    shutdown_logging()
 
 
 app = FastAPI(title="Courtroom", lifespan=lifespan)
@@ -81,6 +103,15 @@ app.add_middleware(
 # --- File Upload Endpoint ---
 
 
+_UPLOAD_CHUNK_SIZE = 1 << 20
+
+
+def _save_upload(src: BinaryIO, dest: Path) -> None:
+    """Copy an uploaded file to disk (blocking; run in a thread)."""
+    with dest.open("wb") as buffer:
+        shutil.copyfileobj(src, buffer, length=_UPLOAD_CHUNK_SIZE)
+
+
 @app.post("/upload")
 async def upload_file(file: UploadFile = File(...)):
     """Upload a file to the server's data directory."""
@@ -90,9 +121,8 @@ async def upload_file(file: UploadFile = File(...)):
         unique_name = f"{uuid.uuid4()}{file_ext}"
         file_path = UPLOAD_DIR / unique_name
 
-        # Save the file
-        with file_path.open("wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        # Save the file off the event loop, in 1 MB blocks
+        await asyncio.to_thread(_save_upload, file.file, file_path)
 
         return {"file_path": str(file_path.absolute()), "original_name": file.filename}
     except Exception as e:
@@ -116,6 +146,7 @@ async def handle_ws(
     """
     await websocket.accept()
     assert runner is not None, "Runner not initialized"
+    assert http_client is not None, "HTTP client not initialized"
 
     slog = get_session_logger(session_id)
     slog.info("ws_connected")
@@ -133,64 +164,80 @@ async def handle_ws(
         "CROSS_EXAM_2",
     }
 
+    # --- Client message handlers, dispatched on "type" ---
+
+    async def on_start(data: dict) -> None:
+        if session is not None:
+            return
+        start_data["dilemma"] = data.get("dilemma", "")
+        start_data["file_paths"] = data.get("file_paths", [])
+        start_event.set()
+        slog.info(
+            "start_message_received",
+            dilemma=start_data["dilemma"],
+            files=len(start_data["file_paths"]),
+        )
+
+    async def on_interrupt(data: dict) -> None:
+        if session is None:
+            return
+        if session.phase_value not in interruptible_phases:
+            slog.warning(
+                "interrupt_ignored_wrong_phase",
+                phase=session.phase_value,
+            )
+            return
+        if session.intervention_pending.is_set():
+            slog.info("interrupt_already_pending")
+            return
+        session.pending_intervention = Intervention.model_construct(content="")
+        session.intervention_pending.set()
+        slog.info("interrupt_received")
+
+    async def on_intervention(data: dict) -> None:
+        if session is None:
+            return
+        content = data.get("content", "")
+        # The only check Intervention's validator would do;
+        # past it, model_construct skips re-validation.
+        if not content or not isinstance(content, str):
+            return
+        intervention = Intervention.model_construct(content=content)
+        await handle_intervention(session, intervention, websocket)
+        session.resume_event.set()
+        slog.info("intervention_submitted", content=content)
+
+    async def on_start_cross_exam(data: dict) -> None:
+        if session is None:
+            return
+        session.cross_exam_event.set()
+        slog.info("cross_exam_start_received")
+
+    handlers: dict[str, Callable[[dict], Awaitable[None]]] = {
+        "start": on_start,
+        "interrupt": on_interrupt,
+        "intervention": on_intervention,
+        "start_cross_exam": on_start_cross_exam,
+    }
+
     async def listen_for_client() -> None:
         """Listen for client messages and route them."""
         try:
             while True:
-                data = await websocket.receive_json()
+                # Frames arrive as text; parse with pydantic-core's
+                # JSON parser rather than the stdlib one.
+                data = from_json(await websocket.receive_text())
                 msg_type = data.get("type")
-                slog.debug(
-                    "ws_message_received",
-                    msg_type=msg_type,
-                )
-
-                if msg_type == "start" and session is None:
-                    start_data["dilemma"] = data.get(
-                        "dilemma", ""
-                    )
-                    start_data["file_paths"] = data.get(
-                        "file_paths", []
-                    )
-                    start_event.set()
-                    slog.info(
-                        "start_message_received",
-                        dilemma=start_data["dilemma"],
-                        files=len(start_data["file_paths"]),
+                if DEBUG_WS:
+                    slog.debug(
+                        "ws_message_received",
+                        msg_type=msg_type,
                     )
 
-                elif msg_type == "interrupt" and session:
-                    if (
-                        session.phase.value
-                        in interruptible_phases
-                    ):
-                        await session.intervention_queue.put(
-                            Intervention(content="")
-                        )
-                        slog.info("interrupt_received")
-                    else:
-                        slog.warning(
-                            "interrupt_ignored_wrong_phase",
-                            phase=session.phase.value,
-                        )
-
-                elif msg_type == "intervention" and session:
-                    content = data.get("content", "")
-                    if content:
-                        intervention = Intervention(
-                            content=content
-                        )
-                        await handle_intervention(
-                            session, intervention, websocket
-                        )
-                        session.resume_event.set()
-                        slog.info(
-                            "intervention_submitted",
-                            content=content,
-                        )
-
-                elif msg_type == "start_cross_exam" and session:
-                    session.cross_exam_event.set()
-                    slog.info("cross_exam_start_received")
+                if isinstance(msg_type, str) and (
+                    handler := handlers.get(msg_type)
+                ):
+                    await handler(data)
         except WebSocketDisconnect:
             if session:
                 session.disconnected = True
@@ -208,7 +255,9 @@ async def handle_ws(
         session = DebateSession(
             session_id=session_id,
             dilemma=start_data["dilemma"],
-            file_paths=start_data.get("file_paths", []),
+        )
+        await session.load_ocr(
+            start_data.get("file_paths", []), http_client
         )
         slog.info("debate_started", dilemma=start_data["dilemma"])
 
@@ -233,7 +282,7 @@ async def handle_ws(
         slog.error("debate_error", error=str(e), exc_info=True)
         try:
             msg = ErrorMessage(message=str(e))
-            await websocket.send_json(msg.model_dump())
+            await websocket.send_text(msg.model_dump_json())
         except Exception:
             pass
     finally:
@@ -259,7 +308,12 @@ async def handle_ws(
 # --- Health Check ---
 
 
+# The body never changes; send the encoded bytes as-is. A fresh
+# Response per request, since middleware edits its header list.
+_HEALTH_BODY = b'{"status":"ok"}'
+
+
 @app.get("/health")
-async def health() -> dict[str, str]:
+async def health() -> Response:
     """Simple health check."""
-    return {"status": "ok"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-import uuid
+import secrets
 from typing import Literal
 
 from pydantic import BaseModel, Field
 
+# Agents that speak in the debate (mirrors AgentRole in frontend/src/types.ts)
+AgentRole = Literal["defense", "prosecution", "researcher", "judge"]
+
 # --- Evidence & Transcript ---
 
 
@@ -25,7 +28,7 @@ class Evidence(BaseModel):
 class TranscriptEntry(BaseModel):
     """One turn in the debate transcript."""
 
-    agent: str
+    agent: AgentRole
     content: str
     phase: str
     interrupted: bool = False
@@ -58,7 +61,7 @@ class AgentStreamMessage(BaseModel):
     """A chunk of streamed agent output."""
 
     type: Literal["agent_stream"] = "agent_stream"
-    agent: str
+    agent: AgentRole
     content: str
     done: bool
     interrupted: bool = False
@@ -111,6 +114,13 @@ class EvidenceMessage(BaseModel):
     url: str = ""
 
 
+class EvidenceBatchMessage(BaseModel):
+    """Several pieces of evidence registered in one burst."""
+
+    type: Literal["evidence_batch"] = "evidence_batch"
+    items: list[Evidence]
+
+
 # --- Client → Server Messages ---
 
 
@@ -146,4 +156,4 @@ class StartCrossExamMessage(BaseModel):
 
 def new_session_id() -> str:
     """Generate a short unique session ID."""
-    return uuid.uuid4().hex[:12]
+    return secrets.token_hex(6)
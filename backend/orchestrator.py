@@ -3,14 +3,23 @@
 from __future__ import annotations
 
 import asyncio
+from contextlib import aclosing
 from enum import Enum
 from pathlib import Path
+from typing import get_args
 
 import structlog
 from dedalus_labs import DedalusRunner
 from fastapi import WebSocket
-
-from backend.agents.base import AgentConfig, Message, start_agent_stream
+from pydantic import BaseModel, ValidationError
+from pydantic_core import to_json
+
+from backend.agents.base import (
+    AgentConfig,
+    Message,
+    batched_stream,
+    start_agent_stream,
+)
 from backend.agents.defense import create_defense_config, create_defense_cross_config
 from backend.agents.judge import create_judge_config
 from backend.agents.prosecutor import (
@@ -21,10 +30,12 @@ from backend.agents.researcher import create_researcher_config
 from backend.agents.tools import Citation
 from backend.logging_config import get_session_logger
 from backend.models import (
+    AgentRole,
     AgentStreamMessage,
     CourtDirective,
     CourtDirectiveMessage,
     Evidence,
+    EvidenceBatchMessage,
     EvidenceMessage,
     Intervention,
     PhaseChangeMessage,
@@ -58,27 +69,67 @@ class DebatePhase(str, Enum):
 
 # Cross-examination configuration
 MAX_CROSS_EXCHANGES = 3  # Each side gets 5 turns (10 total)
+# Runs per phase before giving up (interrupts or empty verdicts)
+MAX_AGENT_ATTEMPTS = 3
 # --- Session State ---
 
 
 FILETYPE_MAPPING = {".pdf": "pdf"}
 
 
+def _encode_document(path: Path) -> str:
+    """Read a document and return it base64-encoded."""
+    return base64.b64encode(path.read_bytes()).decode()
+
+
 class DebateSession:
     """Mutable state for a single debate.
 
-    Holds asyncio primitives (Queue) so this is not
-    a Pydantic model.
+    Holds asyncio primitives (Event) so this is not
+    a Pydantic model. Slotted: the attribute set is fixed, so
+    sessions carry no per-instance __dict__.
     """
 
-    def __init__(self, session_id: str, dilemma: str, file_paths=list[str]) -> None:
+    __slots__ = (
+        "session_id",
+        "dilemma",
+        "phase",
+        "phase_value",
+        "transcript",
+        "evidence",
+        "court_directives",
+        "_history_prefix",
+        "_transcript_messages",
+        "_directive_messages",
+        "pending_intervention",
+        "intervention_pending",
+        "cross_exam_event",
+        "resume_event",
+        "disconnected",
+        "defense_score",
+        "prosecution_score",
+        "log",
+        "ocr",
+    )
+
+    def __init__(self, session_id: str, dilemma: str) -> None:
         self.session_id = session_id
         self.dilemma = dilemma
         self.phase = DebatePhase.INTAKE
+        # phase.value, cached; _transition keeps the two in sync
+        self.phase_value: str = self.phase.value
         self.transcript: list[TranscriptEntry] = []
         self.evidence: list[Evidence] = []
         self.court_directives: list[CourtDirective] = []
-        self.intervention_queue: asyncio.Queue[Intervention] = asyncio.Queue()
+        # Formatted history; entries are rendered as they are added
+        self._history_prefix: list[Message] | None = None
+        self._transcript_messages: list[Message] = []
+        self._directive_messages: list[Message] = []
+        # Single slot: one pending interrupt is enough, and repeats
+        # before it is handled are dropped. The event is set while
+        # the slot is full.
+        self.pending_intervention: Intervention | None = None
+        self.intervention_pending: asyncio.Event = asyncio.Event()
         self.cross_exam_event: asyncio.Event = asyncio.Event()
         self.resume_event: asyncio.Event = asyncio.Event()
         self.disconnected: bool = False
@@ -86,36 +137,95 @@ class DebateSession:
         self.prosecution_score: float = 100.0
         self.log = get_session_logger(session_id)
 
-        if len(file_paths) > 0:
-            datapath = Path(file_paths[0])
-            b64 = base64.b64encode(datapath.read_bytes()).decode()
-            response = httpx.post(
-                "https://api.dedaluslabs.ai/v1/ocr",
-                headers={"Authorization": f"Bearer {os.environ['DEDALUS_API_KEY']}"},
-                json={
-                    "model": "mistral-ocr-latest",
-                    "document": {
-                        "type": "document_url",
-                        "document_url": f"data:application/{FILETYPE_MAPPING[datapath.suffix]};base64,{b64}",
-                    },
+        # OCR page excerpts from an uploaded document (see load_ocr)
+        self.ocr: list[str] | None = None
+
+    def add_transcript_entry(self, entry: TranscriptEntry) -> None:
+        """Record a finished or interrupted agent turn."""
+        self.transcript.append(entry)
+        self._transcript_messages.append(_transcript_message(entry))
+
+    def add_directive(self, directive: CourtDirective) -> None:
+        """Record a court directive from the user."""
+        self.court_directives.append(directive)
+        self._directive_messages.append(_directive_message(directive))
+
+    async def load_ocr(
+        self, file_paths: list[str], client: httpx.AsyncClient
+    ) -> None:
+        """OCR the first uploaded document into `self.ocr`.
+
+        Awaited by the WebSocket handler before the debate starts.
+        The OCR request can take up to two minutes, so it must not
+        block the event loop that serves every other session.
+        `client` is the app-wide client, so its connections are
+        reused across sessions.
+        """
+        if not file_paths:
+            return
+        datapath = Path(file_paths[0])
+        # Encoding a multi-MB PDF is CPU-bound, so it runs with the read
+        b64 = await asyncio.to_thread(_encode_document, datapath)
+        response = await client.post(
+            "https://api.dedaluslabs.ai/v1/ocr",
+            headers={"Authorization": f"Bearer {os.environ['DEDALUS_API_KEY']}"},
+            json={
+                "model": "mistral-ocr-latest",
+                "document": {
+                    "type": "document_url",
+                    "document_url": f"data:application/{FILETYPE_MAPPING[datapath.suffix]};base64,{b64}",
                 },
-                timeout=120.0,
-            )
-            self.ocr = [
-                f"Page {page['index']}:\n{page['markdown'][:200]}..."
-                for page in response.json()["pages"]
-            ]
-        else:
-            self.ocr = None
+            },
+        )
+        self.ocr = [
+            f"Page {page['index']}:\n{page['markdown'][:200]}..."
+            for page in response.json()["pages"]
+        ]
 
 
 # --- Helpers ---
 
 
-async def _send(ws: WebSocket, msg: object) -> None:
-    """Send a Pydantic model as JSON over WebSocket."""
-    if hasattr(msg, "model_dump"):
-        await ws.send_json(msg.model_dump())  # type: ignore[union-attr]
+async def _send(ws: WebSocket, msg: BaseModel) -> None:
+    """Send a Pydantic model as JSON over WebSocket.
+
+    model_dump_json serializes in one pass in pydantic-core,
+    skipping the intermediate dict that send_json would re-encode.
+    """
+    await ws.send_text(msg.model_dump_json())
+
+
+# Phase-change frames never vary, so serialize each one once.
+_PHASE_FRAMES: dict[DebatePhase, str] = {
+    phase: PhaseChangeMessage(phase=phase.value).model_dump_json()
+    for phase in DebatePhase
+}
+
+
+def _token_frame_template(role: AgentRole) -> tuple[str, str]:
+    """Split a serialized token frame around its content field."""
+    frame = AgentStreamMessage(agent=role, content="", done=False).model_dump_json()
+    head, tail = frame.split('"content":""', 1)
+    return head + '"content":', tail
+
+
+# Token frames differ only in their content, so everything else is
+# serialized once per role and only the text is encoded per batch.
+_TOKEN_FRAMES: dict[AgentRole, tuple[str, str]] = {
+    role: _token_frame_template(role) for role in get_args(AgentRole)
+}
+
+# End-of-turn frames are fixed per role as well.
+_DONE_FRAMES: dict[AgentRole, str] = {
+    role: AgentStreamMessage(agent=role, content="", done=True).model_dump_json()
+    for role in get_args(AgentRole)
+}
+_INTERRUPTED_FRAMES: dict[AgentRole, str] = {
+    role: AgentStreamMessage(
+        agent=role, content="", done=True, interrupted=True
+    ).model_dump_json()
+    for role in get_args(AgentRole)
+}
 
 
 async def _transition(
@@ -124,76 +234,134 @@ async def _transition(
     ws: WebSocket,
 ) -> None:
     """Move to a new phase and notify the frontend."""
-    prev = session.phase.value
+    prev = session.phase_value
     session.phase = phase
-    await _send(ws, PhaseChangeMessage(phase=phase.value))
+    session.phase_value = phase.value
+    await ws.send_text(_PHASE_FRAMES[phase])
     session.log.info(
         "phase_transition",
         from_phase=prev,
-        to_phase=phase.value,
+        to_phase=session.phase_value,
     )
 
 
+def _transcript_message(entry: TranscriptEntry) -> Message:
+    """Format one transcript entry as a history message."""
+    return {
+        "role": "assistant",
+        "content": (f"[{entry.agent.upper()}]: {entry.content}"),
+    }
+
+
+def _directive_message(directive: CourtDirective) -> Message:
+    """Format one court directive as a history message."""
+    evidence_text = ""
+    if directive.new_evidence:
+        evidence_text = "\nNew evidence:\n" + "\n".join(
+            f"- {e.title}: {e.snippet}" for e in directive.new_evidence
+        )
+    return {
+        "role": "user",
+        "content": (
+            "COURT DIRECTIVE (from the decision-maker) "
+            f"that interrupted the previous message: "
+            f'"{directive.content}"{evidence_text}'
+        ),
+    }
+
+
 def _build_history(session: DebateSession) -> list[Message]:
     """Build the message history from the transcript.
 
     Converts transcript entries into the
     system/user/assistant message format that
-    the Dedalus SDK expects.
+    the Dedalus SDK expects. Entries and directives are
+    formatted once, when added to the session, so this only
+    concatenates the cached messages.
     """
-    messages: list[Message] = [
-        {
-            "role": "user",
-            "content": f"DILEMMA: {session.dilemma}",
-        },
-    ]
-    if session.ocr is not None:
-        messages.append(
+    if session._history_prefix is None:
+        session._history_prefix = [
             {
                 "role": "user",
-                "content": f"I have added a document to furhter explain the Dilemma, tkae a close look at the text representation: \
-                            Document OCR: {session.ocr}",
+                "content": f"DILEMMA: {session.dilemma}",
             },
-        )
+        ]
+        if session.ocr is not None:
+            session._history_prefix.append(
+                {
+                    "role": "user",
+                    "content": (
+                        "I have added a document to further explain the "
+                        "Dilemma, take a close look at the text "
+                        "representation:\nDocument OCR:\n"
+                        + "\n".join(session.ocr)
+                    ),
+                },
+            )
 
-    for entry in session.transcript:
-        messages.append(
-            {
-                "role": "assistant",
-                "content": (f"[{entry.agent.upper()}]: {entry.content}"),
-            }
-        )
+    return [
+        *session._history_prefix,
+        *session._transcript_messages,
+        *session._directive_messages,
+    ]
 
-    # Inject any court directives
-    for directive in session.court_directives:
-        evidence_text = ""
-        if directive.new_evidence:
-            evidence_text = "\nNew evidence:\n" + "\n".join(
-                f"- {e.title}: {e.snippet}" for e in directive.new_evidence
-            )
-        messages.append(
-            {
-                "role": "user",
-                "content": (
-                    "COURT DIRECTIVE (from the decision-maker) "
-                    f"that interrupted the previous message: "
-                    f'"{directive.content}"{evidence_text}'
-                ),
-            }
-        )
 
-    return messages
+async def _send_evidence(ws: WebSocket, batch: list[dict[str, str]]) -> None:
+    """Send one batch of evidence to the frontend.
+
+    A burst of citations goes out as one evidence_batch frame;
+    a lone citation keeps the plain evidence frame. Items are
+    validated one by one, so a malformed citation is logged and
+    skipped without losing the rest of the batch.
+    """
+    items: list[Evidence] = []
+    for evidence in batch:
+        try:
+            items.append(Evidence.model_validate(evidence))
+        except ValidationError as e:
+            logger.warning(
+                "evidence_invalid",
+                evidence_id=evidence.get("id"),
+                error=str(e),
+            )
+    if not items:
+        return
+
+    if len(items) == 1:
+        await _send(ws, EvidenceMessage.model_validate(items[0].model_dump()))
+    else:
+        await _send(ws, EvidenceBatchMessage(items=items))
+    logger.info(
+        "sent_evidence",
+        evidence_ids=[evidence.id for evidence in items],
+    )
 
 
 async def _forward_evidence(
     citations: Citation,
     ws: WebSocket,
 ) -> None:
-    """Watch the citation queue and send evidence immediately."""
-    while True:
-        evidence = await citations.evidence_queue.get()
-        await _send(ws, EvidenceMessage(type="evidence", **evidence))
-        logger.info("sent_evidence", evidence_id=evidence.get("id"))
+    """Watch the citation queue and send evidence immediately.
+
+    Owns the queue for its whole life: when cancelled, it
+    flushes whatever is still queued before exiting. A failed
+    send is logged and skipped, so one bad batch cannot stop
+    evidence for the rest of the debate.
+    """
+    try:
+        async for batch in citations.drain():
+            try:
+                await _send_evidence(ws, batch)
+            except Exception:
+                logger.error(
+                    "evidence_send_failed",
+                    evidence_ids=[evidence.get("id") for evidence in batch],
+                    exc_info=True,
+                )
+    except asyncio.CancelledError:
+        if batch := citations.take_queued():
+            await _send_evidence(ws, batch)
+        raise
 
 
 # --- Agent Turn Runner ---
@@ -202,17 +370,16 @@ async def _forward_evidence(
 async def run_agent_turn(
     session: DebateSession,
     config: AgentConfig,
-    citations: Citation,
     runner: DedalusRunner,
     ws: WebSocket,
 ) -> bool:
     """Run one agent turn, streaming chunks to the frontend.
 
-    Checks the intervention queue between chunks.
+    Checks for a pending interrupt between token batches.
     Returns True if the turn completed normally,
     False if it was interrupted by a user intervention.
     """
-    slog = session.log.bind(agent=config.role, phase=session.phase.value)
+    slog = session.log.bind(agent=config.role, phase=session.phase_value)
     slog.info("agent_turn_start")
 
     history = _build_history(session)
@@ -224,37 +391,42 @@ async def run_agent_turn(
     # runner.run(stream=True) returns an async iterable directly
     stream = start_agent_stream(runner, config, history)
 
-    partial_response = ""
-    chunk_count = 0
-
-    # Forward evidence to the frontend as soon as it's produced
-    forwarder = asyncio.create_task(_forward_evidence(citations, ws))
-
-    try:
-        async for chunk in stream:
-            chunk_count += 1
-
-            # Check for intervention between chunks
-            try:
-                intervention = session.intervention_queue.get_nowait()
-
-                await _send(
-                    ws,
-                    AgentStreamMessage(
-                        agent=config.role,
-                        content="",
-                        done=True,
-                        interrupted=True,
-                    ),
-                )
-
-                if intervention.content:
+    # Streamed text is collected in parts and joined once per turn
+    parts: list[str] = []
+    partial_length = 0
+    frame_head, frame_tail = _TOKEN_FRAMES[config.role]
+    # Token frames skip the send_text wrapper and go straight to
+    # the ASGI send callable, looked up once per turn.
+    raw_send = ws.send
+    batch_count = 0
+
+    # Tokens are coalesced into short batches so each frame
+    # carries many tokens instead of one.
+    # An interrupt wakes the stream immediately instead of
+    # waiting for the model's next chunk.
+    async with aclosing(
+        batched_stream(stream, wake=session.intervention_pending)
+    ) as batches:
+        async for text in batches:
+            batch_count += 1
+
+            # Check for intervention between batches
+            if session.intervention_pending.is_set():
+                session.intervention_pending.clear()
+                intervention = session.pending_intervention
+                session.pending_intervention = None
+
+                await ws.send_text(_INTERRUPTED_FRAMES[config.role])
+
+                # The slot is filled before the event is set, but a
+                # missing intervention is treated as a bare interrupt.
+                if intervention is not None and intervention.content:
                     # One-step intervention with content
-                    session.transcript.append(
-                        TranscriptEntry(
+                    session.add_transcript_entry(
+                        TranscriptEntry.model_construct(
                             agent=config.role,
-                            content=partial_response,
-                            phase=session.phase.value,
+                            content="".join(parts),
+                            phase=session.phase_value,
                             interrupted=True,
                         )
                     )
@@ -263,78 +435,46 @@ async def run_agent_turn(
                     )
                     slog.info(
                         "agent_interrupted_with_content",
-                        chunks=chunk_count,
+                        batches=batch_count,
                         intervention=intervention.content,
                     )
                 else:
                     # Bare interrupt — discard partial output
                     slog.info(
                         "agent_interrupted_bare",
-                        chunks=chunk_count,
-                        partial_length=len(partial_response),
+                        batches=batch_count,
+                        partial_length=partial_length,
                     )
 
                 return False
 
-            except asyncio.QueueEmpty:
-                pass
-
-            # Extract and forward content tokens
-            if (
-                hasattr(chunk, "choices")
-                and chunk.choices
-                and chunk.choices[0].delta
-                and hasattr(chunk.choices[0].delta, "content")
-                and chunk.choices[0].delta.content
-            ):
-                token = chunk.choices[0].delta.content
-                partial_response += token
-                await _send(
-                    ws,
-                    AgentStreamMessage(
-                        agent=config.role,
-                        content=token,
-                        done=False,
-                    ),
-                )
-    finally:
-        forwarder.cancel()
-        try:
-            await forwarder
-        except (asyncio.CancelledError, Exception):
-            pass
-        # Drain any evidence still in the queue
-        while not citations.evidence_queue.empty():
-            try:
-                evidence = citations.evidence_queue.get_nowait()
-                await _send(
-                    ws,
-                    EvidenceMessage(type="evidence", **evidence),
+            # Forward the batched content tokens
+            if text:
+                parts.append(text)
+                partial_length += len(text)
+                await raw_send(
+                    {
+                        "type": "websocket.send",
+                        "text": f"{frame_head}{to_json(text).decode()}{frame_tail}",
+                    }
                 )
-            except asyncio.QueueEmpty:
-                break
 
-    # Completed without interruption
-    session.transcript.append(
-        TranscriptEntry(
+    # Completed without interruption; every field comes from
+    # typed internal state, so skip re-validation
+    response = "".join(parts)
+    session.add_transcript_entry(
+        TranscriptEntry.model_construct(
             agent=config.role,
-            content=partial_response,
-            phase=session.phase.value,
+            content=response,
+            phase=session.phase_value,
             interrupted=False,
         )
     )
-    await _send(
-        ws,
-        AgentStreamMessage(
-            agent=config.role,
-            content="",
-            done=True,
-        ),
-    )
+    await ws.send_text(_DONE_FRAMES[config.role])
     slog.info(
         "agent_turn_complete",
-        total_chunks=chunk_count,
-        response=partial_response,
+        total_batches=batch_count,
+        response=response,
     )
     return True
 
@@ -349,8 +489,9 @@ async def handle_intervention(
     For MVP, we store the directive and let the next agent
     address it. Full version would also trigger mini-research.
     """
-    directive = CourtDirective(content=intervention.content)
-    session.court_directives.append(directive)
+    # content is already a validated str, so skip re-validation
+    directive = CourtDirective.model_construct(content=intervention.content)
+    session.add_directive(directive)
     await _send(
         ws,
         CourtDirectiveMessage(
@@ -367,7 +508,6 @@ async def handle_intervention(
 # --- Cross-Examination Runner ---
 async def _run_cross_examination(
     session: DebateSession,
-    citations: Citation,
     runner: DedalusRunner,
     ws: WebSocket,
 ) -> None:
@@ -384,12 +524,13 @@ async def _run_cross_examination(
     )
 
     exchange_count = 0
+    pros_config = create_prosecution_cross_config()
+    def_config = create_defense_cross_config()
 
     for exchange_num in range(MAX_CROSS_EXCHANGES):
         # --- Prosecution challenges ---
         await _transition(session, DebatePhase.CROSS_EXAM_1, ws)
-        pros_config = create_prosecution_cross_config()
-        pros_done = await run_agent_turn(session, pros_config, citations, runner, ws)
+        pros_done = await run_agent_turn(session, pros_config, runner, ws)
         exchange_count += 1
 
         # If interrupted, wait for user directive before continuing
@@ -405,9 +546,8 @@ async def _run_cross_examination(
 
         # --- Defense responds ---
         await _transition(session, DebatePhase.CROSS_EXAM_2, ws)
-        def_config = create_defense_cross_config()
         def_done = await run_agent_turn(
-            session, def_config, citations, runner, ws
+            session, def_config, runner, ws
         )
         exchange_count += 1
 
@@ -452,40 +592,75 @@ async def run_debate(
 
     citations = Citation()
 
+    # One forwarder for the whole debate; it flushes whatever
+    # is still queued when cancelled.
+    forwarder = asyncio.create_task(_forward_evidence(citations, ws))
+    try:
+        await _run_phases(session, citations, runner, ws)
+    finally:
+        forwarder.cancel()
+        try:
+            await forwarder
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            session.log.error("evidence_forwarder_failed", exc_info=True)
+
+
+async def _run_opening_turn(
+    session: DebateSession,
+    config: AgentConfig,
+    runner: DedalusRunner,
+    ws: WebSocket,
+) -> bool:
+    """Run one agent's turn until it completes uninterrupted.
+
+    After an interrupt, waits for the user's directive and runs
+    the turn again, at most MAX_AGENT_ATTEMPTS times in total.
+    Returns False if the client disconnected while waiting.
+    """
+    for _ in range(MAX_AGENT_ATTEMPTS):
+        if await run_agent_turn(session, config, runner, ws):
+            return True
+        await session.resume_event.wait()
+        session.resume_event.clear()
+        if session.disconnected:
+            return False
+    session.log.warning(
+        "agent_turn_gave_up",
+        agent=config.role,
+        attempts=MAX_AGENT_ATTEMPTS,
+    )
+    return True
+
+
+async def _run_phases(
+    session: DebateSession,
+    citations: Citation,
+    runner: DedalusRunner,
+    ws: WebSocket,
+) -> None:
+    """Run every phase, from discovery through COMPLETE."""
     # --- Research Information ---
     await _transition(session, DebatePhase.DISCOVERY, ws)
-    done = False
-    while not done:
-        research_config = create_researcher_config(citations)
-        done = await run_agent_turn(session, research_config, citations, runner, ws)
+    if not await _run_opening_turn(
+        session, create_researcher_config(citations), runner, ws
+    ):
+        return
 
     # --- Defense Opening ---
     await _transition(session, DebatePhase.DEFENSE_OPENING, ws)
-    done = False
-    while not done:
-        defense_config = create_defense_config(citations)
-        done = await run_agent_turn(
-            session, defense_config, citations, runner, ws
-        )
-        if not done:
-            await session.resume_event.wait()
-            session.resume_event.clear()
-            if session.disconnected:
-                return
+    if not await _run_opening_turn(
+        session, create_defense_config(citations), runner, ws
+    ):
+        return
 
     # --- Prosecution Opening ---
     await _transition(session, DebatePhase.PROSECUTION_OPENING, ws)
-    done = False
-    while not done:
-        prosecution_config = create_prosecution_config(citations)
-        done = await run_agent_turn(
-            session, prosecution_config, citations, runner, ws
-        )
-        if not done:
-            await session.resume_event.wait()
-            session.resume_event.clear()
-            if session.disconnected:
-                return
+    if not await _run_opening_turn(
+        session, create_prosecution_config(citations), runner, ws
+    ):
+        return
 
     # --- Await User Trigger for Cross-Examination ---
     await _transition(session, DebatePhase.AWAITING_CROSS_EXAM, ws)
@@ -494,17 +669,16 @@ async def run_debate(
     session.log.info("cross_exam_triggered_by_user")
 
     # --- Cross-Examination: Rapid back-and-forth (5 exchanges each) ---
-    await _run_cross_examination(session, citations, runner, ws)
+    await _run_cross_examination(session, runner, ws)
 
     # --- Judge Summary ---
     await _transition(session, DebatePhase.VERDICT, ws)
     done = False
     judge_attempts = 0
-    max_judge_attempts = 3
+    judge_config = create_judge_config()
 
-    while not done and judge_attempts < max_judge_attempts:
-        judge_config = create_judge_config()
-        done = await run_agent_turn(session, judge_config, citations, runner, ws)
+    while not done and judge_attempts < MAX_AGENT_ATTEMPTS:
+        done = await run_agent_turn(session, judge_config, runner, ws)
         judge_attempts += 1
 
         # Check if judge actually produced content
@@ -537,10 +711,10 @@ async def run_debate(
                 )
                 done = False  # Retry if no entry created
 
-    if not done and judge_attempts >= max_judge_attempts:
+    if not done and judge_attempts >= MAX_AGENT_ATTEMPTS:
         session.log.error(
             "judge_failed_after_retries",
-            attempts=max_judge_attempts,
+            attempts=MAX_AGENT_ATTEMPTS,
         )
         # Still transition to COMPLETE even if judge failed
         # The frontend can handle missing judge text
@@ -0,0 +1,59 @@
+"""Tests for the Citation evidence tools."""
+
+from __future__ import annotations
+
+from backend.agents.tools import Citation
+
+
+def test_same_title_different_urls_are_separate_evidence() -> None:
+    """Two sources sharing a generic title keep their own IDs."""
+    citations = Citation()
+    format_evidence = citations.make_format_evidence_tool()
+
+    first = format_evidence(
+        title="Annual Report",
+        snippet="Revenue grew 10%.",
+        source="Acme",
+        url="https://acme.example/report",
+    )
+    second = format_evidence(
+        title="annual report ",
+        snippet="Emissions fell 5%.",
+        source="Globex",
+        url="https://globex.example/report",
+    )
+
+    assert first["id"] != second["id"]
+    assert second["snippet"] == "Emissions fell 5%."
+    assert citations.take_queued() == [first, second]
+
+
+def test_repeated_url_reuses_evidence() -> None:
+    """Citing the same URL again returns the original evidence."""
+    citations = Citation()
+    format_evidence = citations.make_format_evidence_tool()
+
+    first = format_evidence(
+        title="Study", snippet="s", source="Nature", url="https://n.example/a"
+    )
+    again = format_evidence(
+        title="Study (PDF)", snippet="s", source="Nature", url="HTTPS://n.example/a "
+    )
+
+    assert again is first
+    assert citations.take_queued() == [first]
+
+
+def test_title_only_matches_sources_without_url() -> None:
+    """A URL-less entry is not reused for a cited page with a URL."""
+    citations = Citation()
+    format_evidence = citations.make_format_evidence_tool()
+
+    bare = format_evidence(title="Home", snippet="s", source="A")
+    linked = format_evidence(
+        title="Home", snippet="s", source="B", url="https://b.example/"
+    )
+    bare_again = format_evidence(title="home", snippet="s", source="A")
+
+    assert linked["id"] != bare["id"]
+    assert bare_again is bare
@@ -251,6 +251,13 @@ export function useDebateSocket(url: string) {
           ],
         }));
         break;
+
+      case "evidence_batch":
+        setState((prev) => ({
+          ...prev,
+          evidence: [...prev.evidence, ...msg.items],
+        }));
+        break;
     }
   }, []);
 
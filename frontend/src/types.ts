@@ -61,7 +61,8 @@ export type ServerMessage =
       source_type: string;
       date: string;
       url: string;
-    };
+    }
+  | { type: "evidence_batch"; items: EvidenceItem[] };
 
 export type ClientMessage =
   | { type: "start"; dilemma: string; image_data: string | null }